@@ -237,16 +237,16 @@ def elastic_transform(
     if approximate:
         # Approximate computation smooth displacement map with a large enough kernel.
         # On large images (512+) this is approximately 2X times faster
-        dx = random_state.rand(height, width).astype(np.float32) * 2 - 1
+        dx = random_state.random((height, width)).astype(np.float32) * 2 - 1
         cv2.GaussianBlur(dx, (17, 17), sigma, dst=dx)
         dx *= alpha
 
-        dy = random_state.rand(height, width).astype(np.float32) * 2 - 1
+        dy = random_state.random((height, width)).astype(np.float32) * 2 - 1
         cv2.GaussianBlur(dy, (17, 17), sigma, dst=dy)
         dy *= alpha
     else:
-        dx = np.float32(gaussian_filter((random_state.rand(height, width) * 2 - 1), sigma) * alpha)
-        dy = np.float32(gaussian_filter((random_state.rand(height, width) * 2 - 1), sigma) * alpha)
+        dx = np.float32(gaussian_filter((random_state.random((height, width)) * 2 - 1), sigma) * alpha)
+        dy = np.float32(gaussian_filter((random_state.random((height, width)) * 2 - 1), sigma) * alpha)
 
     x, y = np.meshgrid(np.arange(width), np.arange(height))
 
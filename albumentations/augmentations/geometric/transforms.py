@@ -168,7 +168,7 @@ class ElasticTransform(DualTransform):
             interpolation,
             self.border_mode,
             self.value,
-            np.random.RandomState(random_state),
+            np.random.default_rng(random_state),
             self.approximate,
         )
 
@@ -181,7 +181,7 @@ class ElasticTransform(DualTransform):
             cv2.INTER_NEAREST,
             self.border_mode,
             self.mask_value,
-            np.random.RandomState(random_state),
+            np.random.default_rng(random_state),
             self.approximate,
         )
 
@@ -2425,11 +2425,13 @@ class MultiplicativeNoise(ImageOnlyTransform):
             c = 1
 
         if self.elementwise:
-            shape = [h, w, c]
+            random_state = np.random.default_rng(random.randint(0, 2 ** 32 - 1))
+            multiplier = random_state.random((h, w, c), dtype=np.float32)
+            multiplier *= self.multiplier[1] - self.multiplier[0]
+            multiplier += self.multiplier[0]
         else:
-            shape = [c]
+            multiplier = np.random.uniform(self.multiplier[0], self.multiplier[1], [c])
 
-        multiplier = np.random.uniform(self.multiplier[0], self.multiplier[1], shape)
         if F.is_grayscale_image(img):
             multiplier = np.squeeze(multiplier)
 
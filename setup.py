@@ -5,7 +5,7 @@ from setuptools import setup, find_packages
 from pkg_resources import DistributionNotFound, get_distribution
 
 
-INSTALL_REQUIRES = ["numpy>=1.11.1", "scipy", "scikit-image>=0.16.1", "imgaug>=0.4.0", "PyYAML"]
+INSTALL_REQUIRES = ["numpy>=1.17.0", "scipy", "scikit-image>=0.16.1", "imgaug>=0.4.0", "PyYAML"]
 
 # If none of packages in first installed, install second package
 CHOOSE_INSTALL_REQUIRES = [
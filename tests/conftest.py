@@ -1,10 +1,18 @@
+import os
 import sys
 import warnings
+import zlib
 import multiprocessing
 
+import cv2
 import numpy as np
 import pytest
 
+# OpenCV runs its own thread pool inside every call, which oversubscribes the CPU when tests
+# are executed in several processes (pytest-xdist, multiprocessing tests). Keep it single-threaded.
+cv2.setNumThreads(1)
+cv2.ocl.setUseOpenCL(False)
+
 
 try:
     import torch  # skipcq: PYL-W0611
@@ -27,13 +35,35 @@ def pytest_ignore_collect(path):
 
 
 @pytest.fixture
-def image():
-    return np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
+def rng(request):
+    # Seeded from the test id, so every test gets its own data which stays the same between runs.
+    # `hash` is not used because it is randomized for strings in every Python process.
+    return np.random.default_rng(zlib.crc32(request.node.nodeid.encode()))
 
 
 @pytest.fixture
-def mask():
-    return np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
+def image(rng):
+    return rng.integers(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
+
+
+@pytest.fixture
+def mask(rng):
+    return rng.integers(low=0, high=2, size=(100, 100), dtype=np.uint8)
+
+
+@pytest.fixture(scope="module")
+def rand_image():
+    # Shared between tests of a module, so it is made read-only to catch augmentations modifying input in place.
+    image = np.random.default_rng(0).integers(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
+    image.flags.writeable = False
+    return image
+
+
+@pytest.fixture(scope="module")
+def rand_mask():
+    mask = np.random.default_rng(1).integers(low=0, high=2, size=(100, 100), dtype=np.uint8)
+    mask.flags.writeable = False
+    return mask
 
 
 @pytest.fixture
@@ -52,11 +82,11 @@ def keypoints():
 
 
 @pytest.fixture
-def float_image():
-    return np.random.uniform(low=0.0, high=1.0, size=(100, 100, 3)).astype("float32")
+def float_image(rng):
+    return rng.random((100, 100, 3), dtype=np.float32)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiprocessing_context():
     # Usage of `fork` as a start method for multiprocessing could lead to deadlocks on macOS.
     # Because `fork` was the default start method for macOS until Python 3.8
@@ -66,3 +96,15 @@ def multiprocessing_context():
     else:
         method = None
     return multiprocessing.get_context(method)
+
+
+@pytest.fixture(scope="session")
+def multiprocessing_pool(multiprocessing_context):
+    # Starting worker processes is far more expensive than the work done in a single test,
+    # so one small pool is shared between all tests of the session. Tests only need to check
+    # that transforms work in worker processes, not to measure throughput.
+    processes = min(2, os.cpu_count() or 1)
+    pool = multiprocessing_context.Pool(processes, initializer=cv2.setNumThreads, initargs=(1,))
+    yield pool
+    pool.close()
+    pool.join()
@@ -1,3 +1,4 @@
+import os
 from functools import partial
 
 import cv2
@@ -12,12 +13,26 @@ import albumentations.augmentations.geometric.functional as FGeometric
 from torchvision.transforms import ColorJitter
 from PIL import Image
 
+from .utils import unique_uint8
+
 
 def set_seed(seed=0):
     random.seed(seed)
     np.random.seed(seed)
 
 
+_TRANSFORMS_CACHE = {}
+
+
+def get_transform(transform_cls, **params):
+    # Transforms keep no state between calls, so instances built with the same arguments are shared between tests.
+    # Parameters may contain lists, so their repr is used as a part of the key.
+    key = (transform_cls, repr(sorted(params.items())))
+    if key not in _TRANSFORMS_CACHE:
+        _TRANSFORMS_CACHE[key] = transform_cls(p=1, **params)
+    return _TRANSFORMS_CACHE[key]
+
+
 def test_transpose_both_image_and_mask():
     image = np.ones((8, 6, 3))
     mask = np.ones((8, 6))
@@ -28,9 +43,8 @@ def test_transpose_both_image_and_mask():
 
 
 @pytest.mark.parametrize("interpolation", [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
-def test_rotate_interpolation(interpolation):
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
+def test_rotate_interpolation(interpolation, rand_image, rand_mask):
+    image, mask = rand_image, rand_mask
     aug = A.Rotate(limit=(45, 45), interpolation=interpolation, p=1)
     data = aug(image=image, mask=mask)
     expected_image = FGeometric.rotate(image, 45, interpolation=interpolation, border_mode=cv2.BORDER_REFLECT_101)
@@ -40,9 +54,8 @@ def test_rotate_interpolation(interpolation):
 
 
 @pytest.mark.parametrize("interpolation", [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
-def test_shift_scale_rotate_interpolation(interpolation):
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
+def test_shift_scale_rotate_interpolation(interpolation, rand_image, rand_mask):
+    image, mask = rand_image, rand_mask
     aug = A.ShiftScaleRotate(
         shift_limit=(0.2, 0.2), scale_limit=(1.1, 1.1), rotate_limit=(45, 45), interpolation=interpolation, p=1
     )
@@ -58,9 +71,8 @@ def test_shift_scale_rotate_interpolation(interpolation):
 
 
 @pytest.mark.parametrize("interpolation", [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
-def test_optical_distortion_interpolation(interpolation):
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
+def test_optical_distortion_interpolation(interpolation, rand_image, rand_mask):
+    image, mask = rand_image, rand_mask
     aug = A.OpticalDistortion(distort_limit=(0.05, 0.05), shift_limit=(0, 0), interpolation=interpolation, p=1)
     data = aug(image=image, mask=mask)
     expected_image = F.optical_distortion(
@@ -74,9 +86,8 @@ def test_optical_distortion_interpolation(interpolation):
 
 
 @pytest.mark.parametrize("interpolation", [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
-def test_grid_distortion_interpolation(interpolation):
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
+def test_grid_distortion_interpolation(interpolation, rand_image, rand_mask):
+    image, mask = rand_image, rand_mask
     aug = A.GridDistortion(num_steps=1, distort_limit=(0.3, 0.3), interpolation=interpolation, p=1)
     data = aug(image=image, mask=mask)
     expected_image = F.grid_distortion(
@@ -95,17 +106,16 @@ def test_grid_distortion_interpolation(interpolation):
 
 
 @pytest.mark.parametrize("size", [17, 21, 33])
-def test_grid_distortion_steps(size):
-    image = np.random.rand(size, size, 3)
+def test_grid_distortion_steps(size, rng):
+    image = rng.random((size, size, 3))
     aug = A.GridDistortion(num_steps=size - 2, p=1)
     data = aug(image=image)
     assert np.array_equal(data["image"].shape, (size, size, 3))
 
 
 @pytest.mark.parametrize("interpolation", [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
-def test_elastic_transform_interpolation(monkeypatch, interpolation):
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
+def test_elastic_transform_interpolation(monkeypatch, interpolation, rand_image, rand_mask):
+    image, mask = rand_image, rand_mask
     monkeypatch.setattr(
         "albumentations.augmentations.geometric.ElasticTransform.get_params", lambda *_: {"random_state": 1111}
     )
@@ -118,7 +128,7 @@ def test_elastic_transform_interpolation(monkeypatch, interpolation):
         alpha_affine=50,
         interpolation=interpolation,
         border_mode=cv2.BORDER_REFLECT_101,
-        random_state=np.random.RandomState(1111),
+        random_state=np.random.default_rng(1111),
     )
     expected_mask = FGeometric.elastic_transform(
         mask,
@@ -127,7 +137,7 @@ def test_elastic_transform_interpolation(monkeypatch, interpolation):
         alpha_affine=50,
         interpolation=cv2.INTER_NEAREST,
         border_mode=cv2.BORDER_REFLECT_101,
-        random_state=np.random.RandomState(1111),
+        random_state=np.random.default_rng(1111),
     )
     assert np.array_equal(data["image"], expected_image)
     assert np.array_equal(data["mask"], expected_mask)
@@ -151,13 +161,11 @@ def test_elastic_transform_interpolation(monkeypatch, interpolation):
         [A.Perspective, {}],
     ],
 )
-def test_binary_mask_interpolation(augmentation_cls, params):
+def test_binary_mask_interpolation(augmentation_cls, params, rand_image, rand_mask):
     """Checks whether transformations based on DualTransform does not introduce a mask interpolation artifacts"""
-    aug = augmentation_cls(p=1, **params)
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=2, size=(100, 100), dtype=np.uint8)
-    data = aug(image=image, mask=mask)
-    assert np.array_equal(np.unique(data["mask"]), np.array([0, 1]))
+    aug = get_transform(augmentation_cls, **params)
+    data = aug(image=rand_image, mask=rand_mask)
+    assert np.array_equal(unique_uint8(data["mask"]), np.array([0, 1], dtype=np.uint8))
 
 
 @pytest.mark.parametrize(
@@ -177,21 +185,21 @@ def test_binary_mask_interpolation(augmentation_cls, params):
         [A.Perspective, {}],
     ],
 )
-def test_semantic_mask_interpolation(augmentation_cls, params):
+def test_semantic_mask_interpolation(augmentation_cls, params, rand_image, rng):
     """Checks whether transformations based on DualTransform does not introduce a mask interpolation artifacts.
     Note: IAAAffine, IAAPiecewiseAffine, IAAPerspective does not properly operate if mask has values other than {0;1}
     """
-    aug = augmentation_cls(p=1, **params)
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-    mask = np.random.randint(low=0, high=4, size=(100, 100), dtype=np.uint8) * 64
+    aug = get_transform(augmentation_cls, **params)
+    mask = rng.integers(low=0, high=4, size=(100, 100), dtype=np.uint8) * 64
 
-    data = aug(image=image, mask=mask)
-    assert np.array_equal(np.unique(data["mask"]), np.array([0, 64, 128, 192]))
+    data = aug(image=rand_image, mask=mask)
+    # For uint8 values, having the lower 6 bits unset is the same as being one of {0, 64, 128, 192}
+    assert data["mask"].dtype == np.uint8
+    assert not (data["mask"] & 0x3F).any()
 
 
-def __test_multiprocessing_support_proc(args):
-    x, transform = args
-    return transform(image=x)
+def __test_multiprocessing_support_proc(_, transform, image):
+    return transform(image=image)
 
 
 @pytest.mark.parametrize(
@@ -214,22 +222,20 @@ def __test_multiprocessing_support_proc(args):
         [A.Perspective, {}],
     ],
 )
-def test_multiprocessing_support(augmentation_cls, params, multiprocessing_context):
+def test_multiprocessing_support(augmentation_cls, params, multiprocessing_pool, rand_image):
     """Checks whether we can use augmentations in multiprocessing environments"""
     aug = augmentation_cls(p=1, **params)
-    image = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
 
-    pool = multiprocessing_context.Pool(8)
-    pool.map(__test_multiprocessing_support_proc, map(lambda x: (x, aug), [image] * 100))
-    pool.close()
-    pool.join()
+    # The transform and the image are bound to the function, so they are pickled once per chunk rather than per task.
+    results = multiprocessing_pool.imap_unordered(
+        partial(__test_multiprocessing_support_proc, transform=aug, image=rand_image), range(100), chunksize=50
+    )
+    assert len(list(results)) == 100
 
 
-def test_force_apply():
-    """
-    Unit test for https://github.com/albumentations-team/albumentations/issues/189
-    """
-    aug = A.Compose(
+@pytest.fixture(scope="module")
+def force_apply_aug():
+    return A.Compose(
         [
             A.OneOrOther(
                 A.Compose(
@@ -255,7 +261,19 @@ def test_force_apply():
         ]
     )
 
-    res = aug(image=np.zeros((1248, 1248, 3), dtype=np.uint8))
+
+@pytest.fixture(scope="module")
+def force_apply_image():
+    image = np.zeros((1248, 1248, 3), dtype=np.uint8)
+    image.flags.writeable = False
+    return image
+
+
+def test_force_apply(force_apply_aug, force_apply_image):
+    """
+    Unit test for https://github.com/albumentations-team/albumentations/issues/189
+    """
+    res = force_apply_aug(image=force_apply_image)
     assert res["image"].shape[0] in (256, 384, 512)
     assert res["image"].shape[1] in (256, 384, 512)
 
@@ -303,15 +321,17 @@ def test_force_apply():
         [A.Sharpen, {"alpha": [0.2, 0.2], "lightness": [0.5, 0.5]}],
     ],
 )
-def test_additional_targets_for_image_only(augmentation_cls, params):
-    aug = A.Compose([augmentation_cls(always_apply=True, **params)], additional_targets={"image2": "image"})
-    for _i in range(10):
-        image1 = np.random.randint(low=0, high=256, size=(100, 100, 3), dtype=np.uint8)
-        image2 = image1.copy()
-        res = aug(image=image1, image2=image2)
-        aug1 = res["image"]
-        aug2 = res["image2"]
-        assert np.array_equal(aug1, aug2)
+@pytest.mark.parametrize("seed", range(2))
+def test_additional_targets_for_image_only(augmentation_cls, params, seed, rand_image):
+    aug = A.Compose(
+        [get_transform(augmentation_cls, always_apply=True, **params)], additional_targets={"image2": "image"}
+    )
+    set_seed(seed)
+    image2 = rand_image.copy()
+    res = aug(image=rand_image, image2=image2)
+    aug1 = res["image"]
+    aug2 = res["image2"]
+    assert np.array_equal(aug1, aug2)
 
 
 def test_lambda_transform():
@@ -319,7 +339,8 @@ def test_lambda_transform():
         return -image
 
     def one_hot_mask(mask, num_channels, **kwargs):
-        new_mask = np.eye(num_channels, dtype=np.uint8)[mask]
+        new_mask = np.zeros(mask.shape + (num_channels,), dtype=np.uint8)
+        np.put_along_axis(new_mask, mask[..., np.newaxis], 1, axis=-1)
         return new_mask
 
     def vflip_bbox(bbox, **kwargs):
@@ -351,23 +372,23 @@ def test_channel_droput():
 
     transformed = aug(image=img)["image"]
 
-    assert sum(transformed[:, :, c].max() for c in range(img.shape[2])) == 2
+    assert transformed.max(axis=(0, 1)).sum() == 2
 
     aug = A.ChannelDropout(channel_drop_range=(2, 2), always_apply=True)  # Drop two channels
     transformed = aug(image=img)["image"]
 
-    assert sum(transformed[:, :, c].max() for c in range(img.shape[2])) == 1
+    assert transformed.max(axis=(0, 1)).sum() == 1
 
 
 def test_equalize():
     aug = A.Equalize(p=1)
 
-    img = np.random.randint(0, 256, 256 * 256 * 3, np.uint8).reshape((256, 256, 3))
+    img = np.frombuffer(os.urandom(256 * 256 * 3), dtype=np.uint8).reshape((256, 256, 3))
     a = aug(image=img)["image"]
     b = F.equalize(img)
     assert np.all(a == b)
 
-    mask = np.random.randint(0, 2, 256 * 256, np.uint8).reshape((256, 256))
+    mask = np.frombuffer(os.urandom(256 * 256), dtype=np.uint8).reshape((256, 256)) & 1
     aug = A.Equalize(mask=mask, p=1)
     a = aug(image=img)["image"]
     b = F.equalize(img, mask=mask)
@@ -380,12 +401,14 @@ def test_equalize():
     assert np.all(aug(image=img, test=mask)["image"] == F.equalize(img, mask=mask))
 
 
-def test_crop_non_empty_mask():
+def test_crop_non_empty_mask(rng):
     def _test_crop(mask, crop, aug, n=1):
         for _ in range(n):
             augmented = aug(image=mask, mask=mask)
-            np.testing.assert_array_equal(augmented["image"], crop)
-            np.testing.assert_array_equal(augmented["mask"], crop)
+            if not (np.array_equal(augmented["image"], crop) and np.array_equal(augmented["mask"], crop)):
+                # Only fall back to the slower assertions to get a detailed report on failure
+                np.testing.assert_array_equal(augmented["image"], crop)
+                np.testing.assert_array_equal(augmented["mask"], crop)
 
     # test general case
     mask_1 = np.zeros([10, 10])
@@ -412,7 +435,7 @@ def test_crop_non_empty_mask():
     aug_4 = A.CropNonEmptyMaskIfExists(1, 1, ignore_channels=[1])
 
     # test full size crop
-    mask_5 = np.random.random([10, 10, 3])
+    mask_5 = rng.random([10, 10, 3])
     crop_5 = mask_5
     aug_5 = A.CropNonEmptyMaskIfExists(10, 10)
 
@@ -430,8 +453,8 @@ def test_crop_non_empty_mask():
 
 
 @pytest.mark.parametrize("interpolation", [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
-def test_downscale(interpolation):
-    img_float = np.random.rand(100, 100, 3)
+def test_downscale(interpolation, rng):
+    img_float = rng.random((100, 100, 3))
     img_uint = (img_float * 255).astype("uint8")
 
     aug = A.Downscale(scale_min=0.5, scale_max=0.5, interpolation=interpolation, always_apply=True)
@@ -442,8 +465,8 @@ def test_downscale(interpolation):
         np.testing.assert_almost_equal(transformed, func_applied)
 
 
-def test_crop_keypoints():
-    image = np.random.randint(0, 256, (100, 100), np.uint8)
+def test_crop_keypoints(rng):
+    image = rng.integers(0, 256, (100, 100), dtype=np.uint8)
     keypoints = [(50, 50, 0, 0)]
 
     aug = A.Crop(0, 0, 80, 80, p=1)
@@ -455,8 +478,8 @@ def test_crop_keypoints():
     assert result["keypoints"] == [(0, 0, 0, 0)]
 
 
-def test_longest_max_size_keypoints():
-    img = np.random.randint(0, 256, [50, 10], np.uint8)
+def test_longest_max_size_keypoints(rng):
+    img = rng.integers(0, 256, [50, 10], dtype=np.uint8)
     keypoints = [(9, 5, 0, 0)]
 
     aug = A.LongestMaxSize(max_size=100, p=1)
@@ -472,8 +495,8 @@ def test_longest_max_size_keypoints():
     assert result["keypoints"] == [(9, 5, 0, 0)]
 
 
-def test_smallest_max_size_keypoints():
-    img = np.random.randint(0, 256, [50, 10], np.uint8)
+def test_smallest_max_size_keypoints(rng):
+    img = rng.integers(0, 256, [50, 10], dtype=np.uint8)
     keypoints = [(9, 5, 0, 0)]
 
     aug = A.SmallestMaxSize(max_size=100, p=1)
@@ -489,8 +512,8 @@ def test_smallest_max_size_keypoints():
     assert result["keypoints"] == [(9, 5, 0, 0)]
 
 
-def test_resize_keypoints():
-    img = np.random.randint(0, 256, [50, 10], np.uint8)
+def test_resize_keypoints(rng):
+    img = rng.integers(0, 256, [50, 10], dtype=np.uint8)
     keypoints = [(9, 5, 0, 0)]
 
     aug = A.Resize(height=100, width=5, p=1)
@@ -502,37 +525,54 @@ def test_resize_keypoints():
     assert result["keypoints"] == [(9, 5, 0, 0)]
 
 
+def multiply_and_clip(img, multiplier, dtype, maxval, out=None):
+    # Same as `F.clip(img * multiplier, dtype, maxval)`, but computed in float32 in a single (optionally reused) buffer
+    if out is None:
+        out = np.empty(np.broadcast(img, multiplier).shape, dtype=np.float32)
+    np.multiply(img, multiplier, out=out, dtype=np.float32)
+    np.clip(out, 0, maxval, out=out)
+    return out.astype(dtype, copy=False)
+
+
 @pytest.mark.parametrize(
-    "image", [np.random.randint(0, 256, [256, 320], np.uint8), np.random.random([256, 320]).astype(np.float32)]
+    "image",
+    [
+        np.random.default_rng(0).integers(0, 256, [256, 320], dtype=np.uint8),
+        np.random.default_rng(0).random([256, 320], dtype=np.float32),
+    ],
 )
 def test_multiplicative_noise_grayscale(image):
     m = 0.5
     aug = A.MultiplicativeNoise(m, p=1)
     result = aug(image=image)["image"]
-    image = F.clip(image * m, image.dtype, F.MAX_VALUES_BY_DTYPE[image.dtype])
+    image = multiply_and_clip(image, m, image.dtype, F.MAX_VALUES_BY_DTYPE[image.dtype])
     assert np.allclose(image, result)
 
     aug = A.MultiplicativeNoise(elementwise=True, p=1)
     params = aug.get_params_dependent_on_targets({"image": image})
     mul = params["multiplier"]
     assert mul.shape == image.shape
+    assert mul.dtype == np.float32
     result = aug.apply(image, mul)
-    dtype = image.dtype
-    image = image.astype(np.float32) * mul
-    image = F.clip(image, dtype, F.MAX_VALUES_BY_DTYPE[dtype])
+    image = multiply_and_clip(image, mul, image.dtype, F.MAX_VALUES_BY_DTYPE[image.dtype])
     assert np.allclose(image, result)
 
 
 @pytest.mark.parametrize(
-    "image", [np.random.randint(0, 256, [256, 320, 3], np.uint8), np.random.random([256, 320, 3]).astype(np.float32)]
+    "image",
+    [
+        np.random.default_rng(0).integers(0, 256, [256, 320, 3], dtype=np.uint8),
+        np.random.default_rng(0).random([256, 320, 3], dtype=np.float32),
+    ],
 )
 def test_multiplicative_noise_rgb(image):
     dtype = image.dtype
+    buffer = np.empty(image.shape, dtype=np.float32)
 
     m = 0.5
     aug = A.MultiplicativeNoise(m, p=1)
     result = aug(image=image)["image"]
-    image = F.clip(image * m, dtype, F.MAX_VALUES_BY_DTYPE[dtype])
+    image = multiply_and_clip(image, m, dtype, F.MAX_VALUES_BY_DTYPE[dtype])
     assert np.allclose(image, result)
 
     aug = A.MultiplicativeNoise(elementwise=True, p=1)
@@ -540,7 +580,7 @@ def test_multiplicative_noise_rgb(image):
     mul = params["multiplier"]
     assert mul.shape == image.shape[:2] + (1,)
     result = aug.apply(image, mul)
-    image = F.clip(image.astype(np.float32) * mul, dtype, F.MAX_VALUES_BY_DTYPE[dtype])
+    image = multiply_and_clip(image, mul, dtype, F.MAX_VALUES_BY_DTYPE[dtype], out=buffer)
     assert np.allclose(image, result)
 
     aug = A.MultiplicativeNoise(per_channel=True, p=1)
@@ -548,7 +588,7 @@ def test_multiplicative_noise_rgb(image):
     mul = params["multiplier"]
     assert mul.shape == (3,)
     result = aug.apply(image, mul)
-    image = F.clip(image.astype(np.float32) * mul, dtype, F.MAX_VALUES_BY_DTYPE[dtype])
+    image = multiply_and_clip(image, mul, dtype, F.MAX_VALUES_BY_DTYPE[dtype], out=buffer)
     assert np.allclose(image, result)
 
     aug = A.MultiplicativeNoise(elementwise=True, per_channel=True, p=1)
@@ -556,13 +596,13 @@ def test_multiplicative_noise_rgb(image):
     mul = params["multiplier"]
     assert mul.shape == image.shape
     result = aug.apply(image, mul)
-    image = F.clip(image.astype(np.float32) * mul, image.dtype, F.MAX_VALUES_BY_DTYPE[image.dtype])
+    image = multiply_and_clip(image, mul, dtype, F.MAX_VALUES_BY_DTYPE[dtype], out=buffer)
     assert np.allclose(image, result)
 
 
-def test_mask_dropout():
+def test_mask_dropout(rng):
     # In this case we have mask with all ones, so MaskDropout wipe entire mask and image
-    img = np.random.randint(0, 256, [50, 10], np.uint8)
+    img = rng.integers(0, 256, [50, 10], dtype=np.uint8)
     mask = np.ones([50, 10], dtype=np.long)
 
     aug = A.MaskDropout(p=1)
@@ -571,7 +611,7 @@ def test_mask_dropout():
     assert np.all(result["mask"] == 0)
 
     # In this case we have mask with zeros , so MaskDropout will make no changes
-    img = np.random.randint(0, 256, [50, 10], np.uint8)
+    img = rng.integers(0, 256, [50, 10], dtype=np.uint8)
     mask = np.zeros([50, 10], dtype=np.long)
 
     aug = A.MaskDropout(p=1)
@@ -581,9 +621,13 @@ def test_mask_dropout():
 
 
 @pytest.mark.parametrize(
-    "image", [np.random.randint(0, 256, [256, 320, 3], np.uint8), np.random.random([256, 320, 3]).astype(np.float32)]
+    "image",
+    [
+        np.random.default_rng(0).integers(0, 256, [256, 320, 3], dtype=np.uint8),
+        np.random.default_rng(0).random([256, 320, 3], dtype=np.float32),
+    ],
 )
-def test_grid_dropout_mask(image):
+def test_grid_dropout_mask(image, rng):
     mask = np.ones([256, 320], dtype=np.uint8)
     aug = A.GridDropout(p=1, mask_fill_value=0)
     result = aug(image=image, mask=mask)
@@ -601,7 +645,7 @@ def test_grid_dropout_mask(image):
     assert np.all(result["mask"] == 0)
 
     # with mask mask_fill_value=100, mask sum is larger
-    mask = np.random.randint(0, 10, [256, 320], np.uint8)
+    mask = rng.integers(0, 10, [256, 320], dtype=np.uint8)
     aug = A.GridDropout(p=1, mask_fill_value=100)
     result = aug(image=image, mask=mask)
     assert result["image"].sum() < image.sum()
@@ -624,8 +668,10 @@ def test_grid_dropout_mask(image):
         (0.00004, None, None, 2, 100, None, None),
     ],
 )
-def test_grid_dropout_params(ratio, holes_number_x, holes_number_y, unit_size_min, unit_size_max, shift_x, shift_y):
-    img = np.random.randint(0, 256, [256, 320], np.uint8)
+def test_grid_dropout_params(
+    ratio, holes_number_x, holes_number_y, unit_size_min, unit_size_max, shift_x, shift_y, rng
+):
+    img = rng.integers(0, 256, [256, 320], dtype=np.uint8)
 
     aug = A.GridDropout(
         ratio=ratio,
@@ -702,9 +748,8 @@ def test_gaus_blur_limits(blur_limit, sigma, result_blur, result_sigma):
         [1, 1, 1.543, 0],
     ],
 )
-def test_color_jitter(brightness, contrast, saturation, hue):
-    np.random.seed(0)
-    img = np.random.randint(0, 256, [100, 100, 3], dtype=np.uint8)
+def test_color_jitter(brightness, contrast, saturation, hue, rng):
+    img = rng.integers(0, 256, [100, 100, 3], dtype=np.uint8)
     pil_image = Image.fromarray(img)
 
     transform = A.Compose(
@@ -747,8 +792,8 @@ def test_color_jitter(brightness, contrast, saturation, hue):
         [1, 1, 1, -0.432],
     ],
 )
-def test_color_jitter_float_uint8_equal(brightness, contrast, saturation, hue):
-    img = np.random.randint(0, 256, [100, 100, 3], dtype=np.uint8)
+def test_color_jitter_float_uint8_equal(brightness, contrast, saturation, hue, rng):
+    img = rng.integers(0, 256, [100, 100, 3], dtype=np.uint8)
 
     transform = A.Compose(
         [
@@ -774,8 +819,8 @@ def test_color_jitter_float_uint8_equal(brightness, contrast, saturation, hue):
 
 
 @pytest.mark.parametrize(["hue", "sat", "val"], [[13, 17, 23], [14, 18, 24], [131, 143, 151], [132, 144, 152]])
-def test_hue_saturation_value_float_uint8_equal(hue, sat, val):
-    img = np.random.randint(0, 256, [100, 100, 3], dtype=np.uint8)
+def test_hue_saturation_value_float_uint8_equal(hue, sat, val, rng):
+    img = rng.integers(0, 256, [100, 100, 3], dtype=np.uint8)
 
     for i in range(2):
         sign = 1 if i == 0 else -1
@@ -877,7 +922,7 @@ def test_glass_blur_float_uint8_diff_less_than_two(val_uint8):
         [np.uint8, None, 0.1, cv2.BORDER_REFLECT101, 0, False],
     ],
 )
-def test_compare_crop_and_pad(img_dtype, px, percent, pad_mode, pad_cval, keep_size):
+def test_compare_crop_and_pad(img_dtype, px, percent, pad_mode, pad_cval, keep_size, rng):
     h, w, c = 100, 100, 3
     mode_mapping = {
         cv2.BORDER_CONSTANT: "constant",
@@ -890,13 +935,13 @@ def test_compare_crop_and_pad(img_dtype, px, percent, pad_mode, pad_cval, keep_s
     bbox_params = A.BboxParams(format="pascal_voc")
     keypoint_params = A.KeypointParams(format="xy", remove_invisible=False)
 
-    keypoints = np.random.randint(0, min(h, w), [10, 2])
+    keypoints = rng.integers(0, min(h, w), [10, 2])
 
     bboxes = []
     for i in range(10):
-        x1, y1 = np.random.randint(0, min(h, w) - 2, 2)
-        x2 = np.random.randint(x1 + 1, w - 1)
-        y2 = np.random.randint(y1 + 1, h - 1)
+        x1, y1 = rng.integers(0, min(h, w) - 2, 2)
+        x2 = rng.integers(x1 + 1, w - 1)
+        y2 = rng.integers(y1 + 1, h - 1)
         bboxes.append([x1, y1, x2, y2, 0])
 
     transform_albu = A.Compose(
@@ -923,9 +968,9 @@ def test_compare_crop_and_pad(img_dtype, px, percent, pad_mode, pad_cval, keep_s
     )
 
     if img_dtype == np.uint8:
-        img = np.random.randint(0, 256, (h, w, c), dtype=np.uint8)
+        img = rng.integers(0, 256, (h, w, c), dtype=np.uint8)
     else:
-        img = np.random.random((h, w, c)).astype(img_dtype)
+        img = rng.random((h, w, c), dtype=img_dtype)
 
     res_albu = transform_albu(image=img, keypoints=keypoints, bboxes=bboxes)
     res_iaa = transform_iaa(image=img, keypoints=keypoints, bboxes=bboxes)
@@ -939,18 +984,18 @@ def test_compare_crop_and_pad(img_dtype, px, percent, pad_mode, pad_cval, keep_s
         assert np.allclose(item, res_iaa[key]), f"{key} are not equal"
 
 
-def test_perspective_keep_size():
+def test_perspective_keep_size(rng):
     h, w = 100, 100
     img = np.zeros([h, w, 3], dtype=np.uint8)
     h, w = img.shape[:2]
     bboxes = []
     for _ in range(10):
-        x1 = np.random.randint(0, w - 1)
-        y1 = np.random.randint(0, h - 1)
-        x2 = np.random.randint(x1 + 1, w)
-        y2 = np.random.randint(y1 + 1, h)
+        x1 = rng.integers(0, w - 1)
+        y1 = rng.integers(0, h - 1)
+        x2 = rng.integers(x1 + 1, w)
+        y2 = rng.integers(y1 + 1, h)
         bboxes.append([x1, y1, x2, y2])
-    keypoints = [(np.random.randint(0, w), np.random.randint(0, h), np.random.random()) for _ in range(10)]
+    keypoints = [(rng.integers(0, w), rng.integers(0, h), rng.random()) for _ in range(10)]
 
     transform_1 = A.Compose(
         [A.Perspective(keep_size=True, p=1)],
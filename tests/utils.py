@@ -23,6 +23,12 @@ def convert_2d_to_target_format(arrays, target):
     raise ValueError("Unknown target {}".format(target))
 
 
+def unique_uint8(array):
+    # Equivalent of `np.unique` for uint8 arrays that counts values in a single pass instead of sorting.
+    counts = np.bincount(array.ravel(), minlength=256)
+    return np.nonzero(counts)[0].astype(np.uint8)
+
+
 class InMemoryFile(StringIO):
     def __init__(self, value, save_value, file):
         super().__init__(value)